@@ -26,10 +26,27 @@ export class PythonGenerator extends CodeGenerator {
     preludeFile: 'prelude.py',
   };
 
+  // Validator expressions with construction cost (compiled closures, caches,
+  // lookup tables) are hoisted to module-scope declarations; lambdas reference
+  // the hoisted name, so construction happens once at import even when the
+  // expression sits inside a nested lambda body
+  private hoisted: string[] = [];
+  private hoistCount = 0;
+
   escapeString(s: string): string {
     return JSON.stringify(s); // JSON escaping works for Python strings
   }
 
+  /**
+   * Hoist an expression to a module-scope declaration and return its name
+   */
+  private hoist(prefix: string, expr: string): string {
+    this.hoistCount += 1;
+    const name = `_${prefix}${this.hoistCount}`;
+    this.hoisted.push(`${name} = ${expr}`);
+    return name;
+  }
+
   loadPrelude(): string {
     const preludePath = path.join(__dirname, this.config.preludeFile);
     return fs.readFileSync(preludePath, 'utf-8');
@@ -47,7 +64,10 @@ export class PythonGenerator extends CodeGenerator {
     // Pattern
     if (name === 'Pattern') {
       const pattern = desc.constraints?.[0]?.replace('matches ', '').replace(/^`|`$/g, '') ?? '';
-      return `lambda v, p, i: validate_pattern(v, p, i, ${this.escapeString(pattern)})`;
+      // Regex matching is the most expensive leaf check; memoize accepted
+      // values in a wrapper hoisted to module scope so nested positions
+      // share one cache instead of creating a fresh one per call
+      return this.hoist('pat', `cached_validator(lambda v, p, i: validate_pattern(v, p, i, ${this.escapeString(pattern)}))`);
     }
 
     // String
@@ -61,7 +81,10 @@ export class PythonGenerator extends CodeGenerator {
       if (args.length === 0) {
         return 'validate_str';
       }
-      return `lambda v, p, i: validate_str(v, p, i, ${args.join(', ')})`;
+      // Specialized closure: branches and compiled pattern are baked in once
+      // at module load instead of being re-dispatched per call; hoisted so
+      // nested positions reuse the same closure instead of rebuilding it
+      return this.hoist('str', `make_str_validator(${args.join(', ')})`);
     }
 
     // Number
@@ -85,12 +108,26 @@ export class PythonGenerator extends CodeGenerator {
 
     // OneOf
     if (name === 'OneOf' && desc.oneOf) {
-      const options = desc.oneOf.map(opt => this.generateDataValidatorExpr(opt));
-      return `lambda v, p, i: validate_oneof(v, p, i, [${options.join(', ')}])`;
+      return this.generateOneOfExpr(desc.oneOf);
     }
 
     // ListOf
     if (name === 'ListOf' && desc.itemType) {
+      // Numeric item types take the bulk path: one call validating the
+      // whole array instead of one validator call per element
+      if (desc.itemType.name === 'Number') {
+        const numOpts = extractNumberConstraints(desc.itemType.constraints);
+        const listOpts = extractListConstraints(desc.constraints);
+        const args: string[] = [];
+        if (numOpts.integer) args.push('integer=True');
+        if (numOpts.min !== undefined) args.push(`min_val=${numOpts.min}`);
+        if (numOpts.max !== undefined) args.push(`max_val=${numOpts.max}`);
+        if (listOpts.minItems !== undefined) args.push(`min_items=${listOpts.minItems}`);
+        if (listOpts.maxItems !== undefined) args.push(`max_items=${listOpts.maxItems}`);
+        const argStr = args.length > 0 ? `, ${args.join(', ')}` : '';
+        return `lambda v, p, i: validate_num_list(v, p, i${argStr})`;
+      }
+
       const itemExpr = this.generateDataValidatorExpr(desc.itemType);
       const opts = extractListConstraints(desc.constraints);
       const args: string[] = [`item_validator=${itemExpr}`];
@@ -105,24 +142,7 @@ export class PythonGenerator extends CodeGenerator {
       const optional = desc.optional ?? false;
       const args: string[] = [this.escapeString(key)];
 
-      let valueExpr: string | null = null;
-      if (desc.oneOf) {
-        const options = desc.oneOf.map(opt => this.generateDataValidatorExpr(opt));
-        valueExpr = `lambda v, p, i: validate_oneof(v, p, i, [${options.join(', ')}])`;
-      } else if (desc.itemType) {
-        valueExpr = this.generateDataValidatorExpr({
-          name: 'ListOf',
-          itemType: desc.itemType,
-          constraints: desc.constraints,
-        });
-      } else if (desc.children) {
-        valueExpr = this.generateObjectExpr(desc.children);
-      } else if (desc.summary) {
-        valueExpr = this.generateDataValidatorExpr({
-          name: desc.summary,
-          constraints: desc.constraints,
-        });
-      }
+      const valueExpr = this.generateFieldValueExpr(desc);
 
       if (valueExpr) {
         args.push(`validator=${valueExpr}`);
@@ -142,20 +162,144 @@ export class PythonGenerator extends CodeGenerator {
     return '(lambda v, p, i: None)';
   }
 
+  /**
+   * Extract the literal value token from a Literal description
+   */
+  private literalToken(desc: TypeDescription): string {
+    return desc.constraints?.[0]?.replace('equals ', '') ?? 'None';
+  }
+
+  /**
+   * Determine the Python type(s) a branch can accept at top level,
+   * or null when it cannot be determined statically
+   */
+  private topLevelPyTypes(desc: TypeDescription): string[] | null {
+    switch (desc.name) {
+      case 'String':
+      case 'Pattern':
+        return ['str'];
+      case 'Number':
+        return ['int', 'float'];
+      case 'Boolean':
+        return ['bool'];
+      case 'ListOf':
+        return ['list'];
+      case 'Object':
+        return ['dict'];
+      case 'Literal': {
+        const val = this.literalToken(desc);
+        if (val.startsWith('"') || val.startsWith("'")) return ['str'];
+        // Python equality unifies 1 == 1.0 == True, and validate_literal
+        // compares with !=, so a numeric or bool literal must be reachable
+        // from all three types or dispatch would reject values the probe
+        // loop accepts
+        if (/^-?\d+$/.test(val)) return ['int', 'float', 'bool'];
+        if (/^-?\d*\.\d+$/.test(val)) return ['int', 'float', 'bool'];
+        if (val === 'True' || val === 'False') return ['int', 'float', 'bool'];
+        return null;
+      }
+      default:
+        return null;
+    }
+  }
+
+  /**
+   * Generate oneof validator expression, using the fastest applicable form:
+   * literal-only unions become a set membership check, unions with known
+   * branch types become a type-keyed dispatch table, anything else falls
+   * back to probing every validator
+   */
+  private generateOneOfExpr(options: TypeDescription[]): string {
+    if (options.length > 0 && options.every(opt => opt.name === 'Literal')) {
+      const vals = options.map(opt => this.literalToken(opt));
+      const lits = this.hoist('lits', `frozenset((${vals.join(', ')},))`);
+      return `lambda v, p, i: validate_oneof_literals(v, p, i, ${lits})`;
+    }
+
+    const byType = new Map<string, string[]>();
+    let dispatchable = options.length > 0;
+    for (const opt of options) {
+      const types = this.topLevelPyTypes(opt);
+      if (!types) {
+        dispatchable = false;
+        break;
+      }
+      const expr = this.generateDataValidatorExpr(opt);
+      for (const t of types) {
+        let exprs = byType.get(t);
+        if (!exprs) byType.set(t, (exprs = []));
+        exprs.push(expr);
+      }
+    }
+    if (dispatchable) {
+      const entries = [...byType.entries()].map(([t, exprs]) => `${t}: (${exprs.join(', ')},)`);
+      const table = this.hoist('dispatch', `{${entries.join(', ')}}`);
+      return `lambda v, p, i: validate_oneof_dispatch(v, p, i, ${table})`;
+    }
+
+    const exprs = options.map(opt => this.generateDataValidatorExpr(opt));
+    const opts = this.hoist('opts', `[${exprs.join(', ')}]`);
+    return `lambda v, p, i: validate_oneof(v, p, i, ${opts})`;
+  }
+
+  /**
+   * Generate the value validator expression for a Field description,
+   * or null when the field has no value constraint
+   */
+  private generateFieldValueExpr(desc: TypeDescription): string | null {
+    if (desc.oneOf) {
+      return this.generateOneOfExpr(desc.oneOf);
+    }
+    if (desc.itemType) {
+      return this.generateDataValidatorExpr({
+        name: 'ListOf',
+        itemType: desc.itemType,
+        constraints: desc.constraints,
+      });
+    }
+    if (desc.children) {
+      return this.generateObjectExpr(desc.children);
+    }
+    if (desc.summary) {
+      return this.generateDataValidatorExpr({
+        name: desc.summary,
+        constraints: desc.constraints,
+      });
+    }
+    return null;
+  }
+
   generateObjectExpr(
     children: { required?: TypeDescription[] | undefined; optional?: TypeDescription[] | undefined }
   ): string {
-    const fieldExprs: string[] = [];
+    const required = children.required ?? [];
+    const optional = children.optional ?? [];
 
-    for (const child of children.required ?? []) {
-      fieldExprs.push(this.generateDataValidatorExpr(child));
+    if (required.length === 0 && optional.length === 0) {
+      return 'validate_object';
     }
-    for (const child of children.optional ?? []) {
-      fieldExprs.push(this.generateDataValidatorExpr({ ...child, optional: true }));
+
+    // Fused single-pass dispatch: one dict type check and one dict get per
+    // field instead of a validate_field call per key
+    if ([...required, ...optional].every(child => child.name === 'Field' && child.key)) {
+      const entry = (child: TypeDescription): string =>
+        `(${this.escapeString(child.key!)}, ${this.generateFieldValueExpr(child) ?? 'None'})`;
+      const args: string[] = [];
+      if (required.length > 0) {
+        args.push(`required=(${required.map(entry).join(', ')},)`);
+      }
+      if (optional.length > 0) {
+        args.push(`optional=(${optional.map(entry).join(', ')},)`);
+      }
+      return `lambda v, p, i: validate_object_fields(v, p, i, ${args.join(', ')})`;
     }
 
-    if (fieldExprs.length === 0) {
-      return 'validate_object';
+    const fieldExprs: string[] = [];
+    for (const child of required) {
+      fieldExprs.push(this.generateDataValidatorExpr(child));
+    }
+    for (const child of optional) {
+      fieldExprs.push(this.generateDataValidatorExpr({ ...child, optional: true }));
     }
 
     const fieldCalls = fieldExprs.map(expr => `(${expr})(v, p, i)`).join(', ');
@@ -222,7 +366,9 @@ export class PythonGenerator extends CodeGenerator {
       args.push(`content_validator=${contentExpr}`);
     }
 
-    return `lambda path, p, i: validate_bundle(path, p, i, ${args.join(', ')})`;
+    // Factory call: compiled name pattern and zip suffix are bound once at
+    // module load instead of per validation
+    return `make_bundle_validator(${args.join(', ')})`;
   }
 
   generateMainCode(isBundle: boolean): string {
@@ -267,7 +413,11 @@ if __name__ == "__main__":
   }
 
   protected generateValidatorDecl(rootExpr: string, _isBundle: boolean): string {
-    return `_root_validator = ${rootExpr}`;
+    const decl = `_root_validator = ${rootExpr}`;
+    if (this.hoisted.length === 0) {
+      return decl;
+    }
+    return [...this.hoisted, '', decl].join('\n');
   }
 
   protected commentLine(text: string): string {
@@ -4,139 +4,868 @@
 from typing import Any, Callable, TypeAlias
 import os
 import json
+import sys
+import threading
 import zipfile
 import re
 
-# Type aliases
-Issues: TypeAlias = list[dict[str, Any]]
-Validator: TypeAlias = Callable[[Any, list[str], Issues], None]
+# Validation paths are immutable cons cells - (head, tail) tuples ending in
+# None, built leaf-first. One small tuple per level instead of copying a
+# list[str] on every recursion; the dotted string is only materialized
+# when an issue actually fires.
+PathChain: TypeAlias = "tuple[str, PathChain] | None"
 
 
-def add_issue(issues: Issues, path: list[str], code: str, message: str) -> None:
-    """Add a validation issue."""
-    issues.append({"path": ".".join(path) if path else "(root)", "code": code, "message": message})
+class Issues:
+    """Issue buffer in structure-of-arrays form.
+
+    Three parallel lists instead of one dict per issue - a fraction of the
+    allocation and GC pressure when validations fail at scale. Paths are
+    stored as raw chains and messages possibly as deferred callables;
+    to_dicts renders the familiar list-of-dicts shape at the API boundary.
+    """
+    __slots__ = ("paths", "codes", "messages")
+
+    def __init__(self) -> None:
+        self.paths: list = []
+        self.codes: list[str] = []
+        self.messages: list = []
+
+    def add(self, path: "PathChain", code: str, message: Any) -> None:
+        self.paths.append(path)
+        self.codes.append(code)
+        self.messages.append(message)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __bool__(self) -> bool:
+        return bool(self.codes)
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Render issues as dicts, materializing paths and messages."""
+        return [
+            {"path": _format_path(path), "code": code,
+             "message": message if isinstance(message, str) else message()}
+            for path, code, message in zip(self.paths, self.codes, self.messages)
+        ]
+
+
+Validator: TypeAlias = Callable[[Any, "PathChain", Issues], None]
+
+# Optional RE2 backend - linear-time DFA matching with no backtracking.
+# Used per pattern when available; patterns using syntax RE2 rejects
+# (e.g. backreferences, lookarounds) fall back to the stdlib engine.
+try:
+    import re2 as _re2  # type: ignore[import-not-found]
+except ImportError:
+    _re2 = None
+
+# Optional NumPy backend - vectorized bounds checks for numeric arrays
+try:
+    import numpy as _np  # type: ignore[import-not-found]
+except ImportError:
+    _np = None
+
+# Optional orjson backend - parses JSON straight from bytes in C, skipping
+# the intermediate str decode entirely
+try:
+    import orjson as _orjson  # type: ignore[import-not-found]
+except ImportError:
+    _orjson = None
+
+# Compiled regex cache - avoids re-compiling (and re's internal cache lookup)
+# for patterns that fire on every validated value
+_PATTERN_CACHE: dict[str, Any] = {}
+
+
+def _get_pattern(pattern: str) -> Any:
+    """Get a compiled regex for pattern, compiling and caching on first use."""
+    compiled = _PATTERN_CACHE.get(pattern)
+    if compiled is None:
+        if _re2 is not None:
+            try:
+                compiled = _re2.compile(pattern)
+            except _re2.error:
+                compiled = re.compile(pattern)
+        else:
+            compiled = re.compile(pattern)
+        _PATTERN_CACHE[pattern] = compiled
+    return compiled
+
+
+# Precomputed "[i]" strings for the common small list indices
+_IDX_STRS = [f"[{i}]" for i in range(256)]
+
+
+def _format_path(path: "PathChain") -> str:
+    """Materialize a path chain into its dotted string form."""
+    if path is None:
+        return "(root)"
+    parts = []
+    while path is not None:
+        parts.append(path[0])
+        path = path[1]
+    parts.reverse()
+    return ".".join(parts)
+
+
+# Interned issue codes - every issue carries one of these, and interning
+# makes the dict value a shared object with cached hash, cheapening issue
+# construction and downstream comparisons/serialization
+_CODES = {c: sys.intern(c) for c in (
+    "type.mismatch", "str.too_short", "str.too_long", "str.pattern_mismatch",
+    "num.not_integer", "num.too_small", "num.too_large", "literal.mismatch",
+    "pattern.mismatch", "field.missing", "field.unknown",
+    "list.too_short", "list.too_long",
+    "oneof.no_match", "file.not_found", "file.not_file", "file.wrong_ext",
+    "dir.not_found", "dir.not_dir", "json.parse_error", "file.read_error",
+    "bundle.type_mismatch", "bundle.invalid", "bundle.wrong_ext",
+    "bundle.open_error", "bundle.name_mismatch",
+)}
+
+
+# Preformatted "Expected X, got Y" messages keyed by (expected, observed
+# type). Only builtin observed types are cached: user data can carry
+# values of arbitrary classes, and keying by those would grow the cache
+# without bound and pin the class objects alive. The expected strings are
+# a fixed set from our own call sites, so the cache stays small.
+_MSG_TYPES = frozenset((type(None), bool, int, float, str, list, dict,
+                        tuple, set, bytes))
+_TYPE_MSG_CACHE: dict[tuple[str, type], str] = {}
+
+
+def _type_msg(expected: str, observed: type) -> str:
+    msg = _TYPE_MSG_CACHE.get((expected, observed))
+    if msg is None:
+        msg = f"Expected {expected}, got {observed.__name__}"
+        if observed in _MSG_TYPES:
+            _TYPE_MSG_CACHE[(expected, observed)] = msg
+    return msg
+
+
+def add_issue(issues: Issues, path: "PathChain", code: str,
+              message: "str | Callable[[], str]") -> None:
+    """Add a validation issue.
+
+    message may be a zero-argument callable; paths and deferred messages
+    are stored raw and only rendered by Issues.to_dicts, so probe paths
+    that discard their issues never pay for any string formatting.
+    """
+    issues.add(path, _CODES.get(code, code), message)
 
 
 # === Primitive validators ===
 
-def validate_str(value: Any, path: list[str], issues: Issues,
+def validate_str(value: Any, path: "PathChain", issues: Issues,
                  min_length: int | None = None,
                  max_length: int | None = None,
                  pattern: str | None = None) -> None:
     """Validate string value."""
-    if not isinstance(value, str):
-        add_issue(issues, path, "type.mismatch", f"Expected string, got {type(value).__name__}")
+    if type(value) is not str:
+        add_issue(issues, path, "type.mismatch", _type_msg("string", type(value)))
         return
     if min_length is not None and len(value) < min_length:
-        add_issue(issues, path, "str.too_short", f"String length {len(value)} is less than minimum {min_length}")
+        add_issue(issues, path, "str.too_short", lambda n=len(value), m=min_length: f"String length {n} is less than minimum {m}")
     if max_length is not None and len(value) > max_length:
-        add_issue(issues, path, "str.too_long", f"String length {len(value)} exceeds maximum {max_length}")
+        add_issue(issues, path, "str.too_long", lambda n=len(value), m=max_length: f"String length {n} exceeds maximum {m}")
     if pattern is not None:
-        if not re.match(pattern, value):
-            add_issue(issues, path, "str.pattern_mismatch", f"String does not match pattern {pattern}")
+        if not _get_pattern(pattern).match(value):
+            add_issue(issues, path, "str.pattern_mismatch", lambda p_=pattern: f"String does not match pattern {p_}")
 
 
-def validate_num(value: Any, path: list[str], issues: Issues,
+def make_str_validator(min_length: int | None = None,
+                       max_length: int | None = None,
+                       pattern: str | None = None) -> Validator:
+    """Build a string validator specialized for the given constraints.
+
+    Unlike validate_str, the returned closure contains only the branches
+    that apply, with bounds inlined and the compiled pattern's match method
+    bound as a default argument - no per-call kwarg unpacking or dead
+    `is not None` tests. Intended for generated code with hot string fields.
+    """
+    namespace: dict[str, Any] = {"add_issue": add_issue, "_type_msg": _type_msg}
+    extra_args = ""
+    if pattern is not None:
+        extra_args = ", _match=_pattern_match"
+        namespace["_pattern_match"] = _get_pattern(pattern).match
+        namespace["_pattern_msg"] = f"String does not match pattern {pattern}"
+    lines = [
+        f"def _validator(value, path, issues{extra_args}):",
+        "    if type(value) is not str:",
+        "        add_issue(issues, path, \"type.mismatch\", _type_msg(\"string\", type(value)))",
+        "        return",
+    ]
+    if min_length is not None:
+        lines.append(f"    if len(value) < {min_length}:")
+        lines.append("        add_issue(issues, path, \"str.too_short\", "
+                     f"f\"String length {{len(value)}} is less than minimum {min_length}\")")
+    if max_length is not None:
+        lines.append(f"    if len(value) > {max_length}:")
+        lines.append("        add_issue(issues, path, \"str.too_long\", "
+                     f"f\"String length {{len(value)}} exceeds maximum {max_length}\")")
+    if pattern is not None:
+        lines.append("    if not _match(value):")
+        lines.append("        add_issue(issues, path, \"str.pattern_mismatch\", _pattern_msg)")
+    exec(compile("\n".join(lines), "<make_str_validator>", "exec"), namespace)
+    return namespace["_validator"]
+
+
+def validate_num(value: Any, path: "PathChain", issues: Issues,
                  min_val: float | None = None,
                  max_val: float | None = None,
                  integer: bool = False) -> None:
     """Validate number value."""
-    if not isinstance(value, (int, float)) or isinstance(value, bool):
-        add_issue(issues, path, "type.mismatch", f"Expected number, got {type(value).__name__}")
+    t = type(value)
+    if t is not int and t is not float:
+        add_issue(issues, path, "type.mismatch", _type_msg("number", t))
         return
-    if integer and not isinstance(value, int):
-        add_issue(issues, path, "num.not_integer", f"Expected integer, got {value}")
+    if integer and t is not int:
+        add_issue(issues, path, "num.not_integer", lambda v=value: f"Expected integer, got {v}")
     if min_val is not None and value < min_val:
-        add_issue(issues, path, "num.too_small", f"Number {value} is less than minimum {min_val}")
+        add_issue(issues, path, "num.too_small", lambda v=value, m=min_val: f"Number {v} is less than minimum {m}")
     if max_val is not None and value > max_val:
-        add_issue(issues, path, "num.too_large", f"Number {value} exceeds maximum {max_val}")
+        add_issue(issues, path, "num.too_large", lambda v=value, m=max_val: f"Number {v} exceeds maximum {m}")
 
 
-def validate_bool(value: Any, path: list[str], issues: Issues) -> None:
+def validate_bool(value: Any, path: "PathChain", issues: Issues) -> None:
     """Validate boolean value."""
-    if not isinstance(value, bool):
-        add_issue(issues, path, "type.mismatch", f"Expected boolean, got {type(value).__name__}")
+    if type(value) is not bool:
+        add_issue(issues, path, "type.mismatch", _type_msg("boolean", type(value)))
 
 
-def validate_literal(value: Any, path: list[str], issues: Issues, expected: Any) -> None:
+def validate_literal(value: Any, path: "PathChain", issues: Issues, expected: Any) -> None:
     """Validate literal value."""
     if value != expected:
-        add_issue(issues, path, "literal.mismatch", f"Expected {expected!r}, got {value!r}")
+        add_issue(issues, path, "literal.mismatch", lambda e=expected, v=value: f"Expected {e!r}, got {v!r}")
 
 
-def validate_pattern(value: Any, path: list[str], issues: Issues, pattern: str) -> None:
+def validate_pattern(value: Any, path: "PathChain", issues: Issues, pattern: str) -> None:
     """Validate value matches regex pattern."""
-    if not isinstance(value, str):
-        add_issue(issues, path, "type.mismatch", f"Expected string for pattern match, got {type(value).__name__}")
+    if type(value) is not str:
+        add_issue(issues, path, "type.mismatch", _type_msg("string for pattern match", type(value)))
         return
-    if not re.match(pattern, value):
-        add_issue(issues, path, "pattern.mismatch", f"Value does not match pattern {pattern}")
+    if not _get_pattern(pattern).match(value):
+        add_issue(issues, path, "pattern.mismatch", lambda p_=pattern: f"Value does not match pattern {p_}")
+
+
+# Optional compiled accelerator. The prelude is embedded into generated
+# validators as a single source file, so it cannot ship a C extension of
+# its own; a host application may install one exposing the same signatures
+# and it transparently replaces the hot pure-Python primitives.
+try:
+    from _specspec_accel import (  # type: ignore[no-redef] # noqa: F811
+        validate_str, validate_num, validate_bool, validate_literal,
+    )
+except ImportError:
+    pass
+
+
+# Active work stack for validate_iterative, one per thread. When set,
+# container validators push (value, path, validator) work items here
+# instead of recursing. Thread-local so concurrent validations never see
+# (or push onto) another thread's stack; the class attribute is the
+# default every thread starts from.
+class _WorkLocal(threading.local):
+    stack: list | None = None
+
+
+_WORK = _WorkLocal()
 
 
 # === Structural validators ===
 
-def validate_object(value: Any, path: list[str], issues: Issues) -> bool:
+def validate_object(value: Any, path: "PathChain", issues: Issues) -> bool:
     """Check value is an object (dict). Returns False if not."""
-    if not isinstance(value, dict):
-        add_issue(issues, path, "type.mismatch", f"Expected object, got {type(value).__name__}")
+    if type(value) is not dict:
+        add_issue(issues, path, "type.mismatch", _type_msg("object", type(value)))
         return False
     return True
 
 
-def validate_field(obj: Any, path: list[str], issues: Issues,
+def validate_field(obj: Any, path: "PathChain", issues: Issues,
                    key: str, validator: Validator | None = None,
                    optional: bool = False) -> None:
     """Validate a field in an object."""
-    if not isinstance(obj, dict):
+    if type(obj) is not dict:
         return  # Parent validation will catch this
 
     if key not in obj:
         if not optional:
-            add_issue(issues, path, "field.missing", f"Missing required field: {key}")
+            add_issue(issues, path, "field.missing", lambda k=key: f"Missing required field: {k}")
         return
 
     if validator is not None:
-        validator(obj[key], path + [key], issues)
+        stack = _WORK.stack
+        if stack is not None:
+            stack.append((obj[key], (key, path), validator))
+        else:
+            validator(obj[key], (key, path), issues)
+
 
+# Sentinel distinguishing absent fields from explicit None values
+_MISSING = object()
 
-def validate_list(value: Any, path: list[str], issues: Issues,
+
+def validate_object_fields(obj: Any, path: "PathChain", issues: Issues,
+                           required: tuple = (),
+                           optional: tuple = ()) -> None:
+    """Validate an object and all of its fields in one pass.
+
+    required and optional are tuples of (key, validator) pairs, validator
+    possibly None. Codegen emits this instead of validate_object plus one
+    validate_field call per key, so the dict type check runs once and each
+    field costs a single dict get.
+    """
+    if type(obj) is not dict:
+        add_issue(issues, path, "type.mismatch", _type_msg("object", type(obj)))
+        return
+
+    stack = _WORK.stack
+    for key, validator in required:
+        value = obj.get(key, _MISSING)
+        if value is _MISSING:
+            add_issue(issues, path, "field.missing", lambda k=key: f"Missing required field: {k}")
+        elif validator is not None:
+            if stack is not None:
+                stack.append((value, (key, path), validator))
+            else:
+                validator(value, (key, path), issues)
+    for key, validator in optional:
+        value = obj.get(key, _MISSING)
+        if value is not _MISSING and validator is not None:
+            if stack is not None:
+                stack.append((value, (key, path), validator))
+            else:
+                validator(value, (key, path), issues)
+
+
+def validate_object_strict(obj: Any, path: "PathChain", issues: Issues,
+                           required: frozenset = frozenset(),
+                           optional: frozenset = frozenset(),
+                           validators: dict[str, Validator] | None = None) -> None:
+    """Validate an object that rejects keys outside its schema.
+
+    required and optional are frozensets of key names; validators maps a
+    key to its value validator (keys without an entry are presence-only).
+    Missing and unknown keys fall out of two C-level set subtractions
+    against the dict's key view instead of a per-key Python loop.
+    """
+    if type(obj) is not dict:
+        add_issue(issues, path, "type.mismatch", _type_msg("object", type(obj)))
+        return
+
+    keys = obj.keys()
+    for key in required - keys:
+        add_issue(issues, path, "field.missing", lambda k=key: f"Missing required field: {k}")
+    for key in keys - required - optional:
+        add_issue(issues, path, "field.unknown", lambda k=key: f"Unknown field: {k}")
+
+    if validators:
+        stack = _WORK.stack
+        for key, value in obj.items():
+            validator = validators.get(key)
+            if validator is not None:
+                if stack is not None:
+                    stack.append((value, (key, path), validator))
+                else:
+                    validator(value, (key, path), issues)
+
+
+def validate_list(value: Any, path: "PathChain", issues: Issues,
                   item_validator: Validator | None = None,
                   min_items: int | None = None,
                   max_items: int | None = None) -> None:
     """Validate list/array value."""
-    if not isinstance(value, list):
-        add_issue(issues, path, "type.mismatch", f"Expected array, got {type(value).__name__}")
+    if type(value) is not list:
+        add_issue(issues, path, "type.mismatch", _type_msg("array", type(value)))
         return
 
     if min_items is not None and len(value) < min_items:
-        add_issue(issues, path, "list.too_short", f"Array length {len(value)} is less than minimum {min_items}")
+        add_issue(issues, path, "list.too_short", lambda n=len(value), m=min_items: f"Array length {n} is less than minimum {m}")
     if max_items is not None and len(value) > max_items:
-        add_issue(issues, path, "list.too_long", f"Array length {len(value)} exceeds maximum {max_items}")
+        add_issue(issues, path, "list.too_long", lambda n=len(value), m=max_items: f"Array length {n} exceeds maximum {m}")
 
     if item_validator is not None:
-        for i, item in enumerate(value):
-            item_validator(item, path + [f"[{i}]"], issues)
+        stack = _WORK.stack
+        if stack is not None:
+            # Push in reverse so items drain in order
+            for i in range(len(value) - 1, -1, -1):
+                idx = _IDX_STRS[i] if i < 256 else f"[{i}]"
+                stack.append((value[i], (idx, path), item_validator))
+        else:
+            for i, item in enumerate(value):
+                idx = _IDX_STRS[i] if i < 256 else f"[{i}]"
+                item_validator(item, (idx, path), issues)
+
+
+def _idx_str(i: int) -> str:
+    """Index path component, from the precomputed table when possible."""
+    return _IDX_STRS[i] if i < 256 else f"[{i}]"
+
+
+def validate_num_list(value: Any, path: "PathChain", issues: Issues,
+                      min_val: float | None = None,
+                      max_val: float | None = None,
+                      integer: bool = False,
+                      min_items: int | None = None,
+                      max_items: int | None = None) -> None:
+    """Validate a list of numbers in bulk.
+
+    Codegen emits this instead of validate_list + validate_num when the
+    item type is numeric. Homogeneous arrays get a vectorized bounds check
+    via NumPy when it is installed; otherwise a tight loop runs the checks
+    inline without a per-item validator call. Issues match what the
+    generic path would produce.
+    """
+    if type(value) is not list:
+        add_issue(issues, path, "type.mismatch", _type_msg("array", type(value)))
+        return
+
+    if min_items is not None and len(value) < min_items:
+        add_issue(issues, path, "list.too_short", lambda n=len(value), m=min_items: f"Array length {n} is less than minimum {m}")
+    if max_items is not None and len(value) > max_items:
+        add_issue(issues, path, "list.too_long", lambda n=len(value), m=max_items: f"Array length {n} exceeds maximum {m}")
+
+    if _np is not None and value:
+        # numpy folds bools into int arrays (asarray([1, True]) is int64),
+        # so dtype sniffing cannot stand in for the type check; scan the
+        # real element types and vectorize only for clean ints/floats
+        types = set(map(type, value))
+        if types <= {int, float} and not (integer and float in types):
+            try:
+                arr = _np.asarray(value)
+            except Exception:
+                arr = None
+        else:
+            arr = None
+        # oversized ints overflow to kind 'O' and still take the loop
+        if arr is not None and arr.ndim == 1 and arr.dtype.kind in "if":
+            bad = None
+            if min_val is not None:
+                bad = arr < min_val
+            if max_val is not None:
+                over = arr > max_val
+                bad = over if bad is None else bad | over
+            if bad is not None and bad.any():
+                for i in _np.nonzero(bad)[0]:
+                    item = value[int(i)]
+                    item_path = (_idx_str(int(i)), path)
+                    if min_val is not None and item < min_val:
+                        add_issue(issues, item_path, "num.too_small", lambda v=item, m=min_val: f"Number {v} is less than minimum {m}")
+                    if max_val is not None and item > max_val:
+                        add_issue(issues, item_path, "num.too_large", lambda v=item, m=max_val: f"Number {v} exceeds maximum {m}")
+            return
+
+    for i, item in enumerate(value):
+        t = type(item)
+        if t is int or t is float:
+            if integer and t is not int:
+                add_issue(issues, (_idx_str(i), path), "num.not_integer", lambda v=item: f"Expected integer, got {v}")
+            if min_val is not None and item < min_val:
+                add_issue(issues, (_idx_str(i), path), "num.too_small", lambda v=item, m=min_val: f"Number {v} is less than minimum {m}")
+            if max_val is not None and item > max_val:
+                add_issue(issues, (_idx_str(i), path), "num.too_large", lambda v=item, m=max_val: f"Number {v} exceeds maximum {m}")
+        else:
+            add_issue(issues, (_idx_str(i), path), "type.mismatch", _type_msg("number", type(item)))
+
 
+class _StopValidation(BaseException):
+    """Raised by a _FailFast buffer to unwind on the first issue.
+
+    Derives from BaseException so probe unwinding cannot be swallowed by
+    broad `except Exception` handlers inside validators.
+    """
 
-def validate_oneof(value: Any, path: list[str], issues: Issues,
+
+class _FailFast(Issues):
+    """Issues buffer whose first add aborts validation.
+
+    The pending issue travels on the exception as a (path, code, message)
+    tuple; the buffer itself is never mutated, so instances are reusable.
+    """
+    __slots__ = ()
+
+    def add(self, path: "PathChain", code: str, message: Any) -> None:
+        raise _StopValidation((path, code, message))
+
+
+# Shared probe buffer. _FailFast carries no state (add raises instead of
+# appending), so one instance serves every probe on every thread and the
+# per-probe allocation disappears.
+_FAIL_FAST = _FailFast()
+
+
+def validate_oneof(value: Any, path: "PathChain", issues: Issues,
                    validators: list[Validator],
                    descriptions: list[str] | None = None) -> None:
     """Validate value matches one of the validators."""
-    for validator in validators:
-        test_issues: Issues = []
-        validator(value, path, test_issues)
-        if not test_issues:
-            return  # Matched
+    saved = _WORK.stack
+    _WORK.stack = None  # Probes must recurse eagerly, not defer children
+    try:
+        for validator in validators:
+            try:
+                validator(value, path, _FAIL_FAST)
+                return  # Matched
+            except _StopValidation:
+                continue
+    finally:
+        _WORK.stack = saved
+
+    add_issue(issues, path, "oneof.no_match",
+              lambda d=descriptions: "Value does not match " + (", ".join(d) if d else "any of the options"))
+
+
+def validate_oneof_literals(value: Any, path: "PathChain", issues: Issues,
+                            literals: frozenset,
+                            descriptions: list[str] | None = None) -> None:
+    """Validate value is one of a set of literal values.
+
+    Codegen emits this instead of validate_oneof when every branch is a
+    literal - one hash lookup instead of N validator probes.
+    """
+    try:
+        if value in literals:
+            return
+    except TypeError:
+        pass  # unhashable value cannot equal any hashable literal
+
+    add_issue(issues, path, "oneof.no_match",
+              lambda d=descriptions: "Value does not match " + (", ".join(d) if d else "any of the options"))
+
 
-    desc = ", ".join(descriptions) if descriptions else "any of the options"
-    add_issue(issues, path, "oneof.no_match", f"Value does not match {desc}")
+def validate_oneof_dispatch(value: Any, path: "PathChain", issues: Issues,
+                            dispatch: dict[type, tuple[Validator, ...]],
+                            descriptions: list[str] | None = None) -> None:
+    """Validate value matches one of the validators, keyed by top-level type.
+
+    Codegen builds the dispatch table when every branch has a known
+    top-level type, so only validators that could accept the value's type
+    are probed. Branches with no entry for the value's type fail directly.
+    """
+    saved = _WORK.stack
+    _WORK.stack = None  # Probes must recurse eagerly, not defer children
+    try:
+        for validator in dispatch.get(type(value), ()):
+            try:
+                validator(value, path, _FAIL_FAST)
+                return  # Matched
+            except _StopValidation:
+                continue
+    finally:
+        _WORK.stack = saved
+
+    add_issue(issues, path, "oneof.no_match",
+              lambda d=descriptions: "Value does not match " + (", ".join(d) if d else "any of the options"))
+
+
+# Memoized matches_validator verdicts keyed by (validator, type, value).
+# The type is part of the key because hashing unifies 1 == 1.0 == True,
+# yet validators distinguish them (validate_num rejects bools).
+# Cleared wholesale on overflow, mirroring re's internal cache strategy.
+_MATCH_CACHE: dict[tuple, bool] = {}
+_MATCH_CACHE_MAX = 4096
 
 
 def matches_validator(value: Any, validator: Validator) -> bool:
-    """Test if value matches a validator without adding issues."""
-    test_issues: Issues = []
-    validator(value, [], test_issues)
-    return len(test_issues) == 0
+    """Test if value matches a validator without adding issues.
+
+    Verdicts for hashable values are memoized, so repeated probes of the
+    same value (common for enum strings and ID formats) become a single
+    dict lookup. Unhashable values always take the real path.
+    """
+    try:
+        key = (validator, type(value), value)
+        hit = _MATCH_CACHE.get(key)
+    except TypeError:
+        key = None
+        hit = None
+    if hit is not None:
+        return hit
+    saved = _WORK.stack
+    _WORK.stack = None  # Probes must recurse eagerly, not defer children
+    try:
+        validator(value, None, _FAIL_FAST)
+        ok = True
+    except _StopValidation:
+        ok = False
+    finally:
+        _WORK.stack = saved
+    if key is not None:
+        if len(_MATCH_CACHE) >= _MATCH_CACHE_MAX:
+            _MATCH_CACHE.clear()
+        _MATCH_CACHE[key] = ok
+    return ok
+
+
+def cached_validator(validator: Validator, maxsize: int = 1024) -> Validator:
+    """Wrap a validator with a cache of values it has already accepted.
+
+    Hashable values that previously validated cleanly skip re-validation
+    entirely. Failures are never cached, so issue messages stay exact, and
+    unhashable values fall through to the wrapped validator. Only suitable
+    for validators whose outcome depends on the value alone.
+    """
+    # Keyed by (type, value) so 1, 1.0 and True cache separately even
+    # though they hash and compare equal
+    accepted: dict[tuple[type, Any], bool] = {}
+
+    def _cached(value: Any, path: "PathChain", issues: Issues) -> None:
+        try:
+            if (type(value), value) in accepted:
+                return
+        except TypeError:
+            validator(value, path, issues)
+            return
+        before = len(issues)
+        validator(value, path, issues)
+        if len(issues) == before:
+            if len(accepted) >= maxsize:
+                accepted.clear()
+            accepted[(type(value), value)] = True
+
+    return _cached
+
+
+# === Runtime schema compilation ===
+
+# Compiled schema validators keyed by canonical schema JSON
+_COMPILED_CACHE: dict[str, Validator] = {}
+
+
+def _bind_const(namespace: dict[str, Any], counter: list[int], prefix: str, obj: Any) -> str:
+    """Bind obj into the compile namespace under a fresh name."""
+    counter[0] += 1
+    name = f"_{prefix}{counter[0]}"
+    namespace[name] = obj
+    return name
+
+
+def _emit_schema(node: dict[str, Any], v: str, p: str, lines: list[str], ind: str,
+                 namespace: dict[str, Any], counter: list[int]) -> None:
+    """Emit inlined validation source for one schema IR node."""
+    kind = node["kind"]
+
+    if kind == "str":
+        lines.append(f"{ind}if type({v}) is not str:")
+        lines.append(f'{ind}    add_issue(issues, {p}, "type.mismatch", _type_msg("string", type({v})))')
+        checks: list[str] = []
+        min_length = node.get("min_length")
+        max_length = node.get("max_length")
+        pattern = node.get("pattern")
+        if min_length is not None:
+            checks.append(f"if len({v}) < {min_length}:")
+            checks.append(f'    add_issue(issues, {p}, "str.too_short", f"String length {{len({v})}} is less than minimum {min_length}")')
+        if max_length is not None:
+            checks.append(f"if len({v}) > {max_length}:")
+            checks.append(f'    add_issue(issues, {p}, "str.too_long", f"String length {{len({v})}} exceeds maximum {max_length}")')
+        if pattern is not None:
+            match_name = _bind_const(namespace, counter, "match", _get_pattern(pattern).match)
+            msg_name = _bind_const(namespace, counter, "msg", f"String does not match pattern {pattern}")
+            checks.append(f"if not {match_name}({v}):")
+            checks.append(f'    add_issue(issues, {p}, "str.pattern_mismatch", {msg_name})')
+        if checks:
+            lines.append(f"{ind}else:")
+            lines.extend(f"{ind}    {line}" for line in checks)
+        return
+
+    if kind == "num":
+        lines.append(f"{ind}if type({v}) is not int and type({v}) is not float:")
+        lines.append(f'{ind}    add_issue(issues, {p}, "type.mismatch", _type_msg("number", type({v})))')
+        checks = []
+        if node.get("integer"):
+            checks.append(f"if type({v}) is not int:")
+            checks.append(f'    add_issue(issues, {p}, "num.not_integer", f"Expected integer, got {{{v}}}")')
+        min_val = node.get("min")
+        max_val = node.get("max")
+        if min_val is not None:
+            checks.append(f"if {v} < {min_val}:")
+            checks.append(f'    add_issue(issues, {p}, "num.too_small", f"Number {{{v}}} is less than minimum {min_val}")')
+        if max_val is not None:
+            checks.append(f"if {v} > {max_val}:")
+            checks.append(f'    add_issue(issues, {p}, "num.too_large", f"Number {{{v}}} exceeds maximum {max_val}")')
+        if checks:
+            lines.append(f"{ind}else:")
+            lines.extend(f"{ind}    {line}" for line in checks)
+        return
+
+    if kind == "bool":
+        lines.append(f"{ind}if type({v}) is not bool:")
+        lines.append(f'{ind}    add_issue(issues, {p}, "type.mismatch", _type_msg("boolean", type({v})))')
+        return
+
+    if kind == "literal":
+        lit_name = _bind_const(namespace, counter, "lit", node["value"])
+        lines.append(f"{ind}if {v} != {lit_name}:")
+        lines.append(f'{ind}    add_issue(issues, {p}, "literal.mismatch", f"Expected {{{lit_name}!r}}, got {{{v}!r}}")')
+        return
+
+    if kind == "pattern":
+        match_name = _bind_const(namespace, counter, "match", _get_pattern(node["pattern"]).match)
+        msg_name = _bind_const(namespace, counter, "msg", f"Value does not match pattern {node['pattern']}")
+        lines.append(f"{ind}if type({v}) is not str:")
+        lines.append(f'{ind}    add_issue(issues, {p}, "type.mismatch", _type_msg("string for pattern match", type({v})))')
+        lines.append(f"{ind}elif not {match_name}({v}):")
+        lines.append(f'{ind}    add_issue(issues, {p}, "pattern.mismatch", {msg_name})')
+        return
+
+    if kind == "list":
+        lines.append(f"{ind}if type({v}) is not list:")
+        lines.append(f'{ind}    add_issue(issues, {p}, "type.mismatch", _type_msg("array", type({v})))')
+        lines.append(f"{ind}else:")
+        body_emitted = False
+        min_items = node.get("min_items")
+        max_items = node.get("max_items")
+        if min_items is not None:
+            lines.append(f"{ind}    if len({v}) < {min_items}:")
+            lines.append(f'{ind}        add_issue(issues, {p}, "list.too_short", f"Array length {{len({v})}} is less than minimum {min_items}")')
+            body_emitted = True
+        if max_items is not None:
+            lines.append(f"{ind}    if len({v}) > {max_items}:")
+            lines.append(f'{ind}        add_issue(issues, {p}, "list.too_long", f"Array length {{len({v})}} exceeds maximum {max_items}")')
+            body_emitted = True
+        item = node.get("item")
+        if item is not None:
+            counter[0] += 1
+            n = counter[0]
+            lines.append(f"{ind}    for _i{n}, _v{n} in enumerate({v}):")
+            lines.append(f"{ind}        _p{n} = (_idx_str(_i{n}), {p})")
+            _emit_schema(item, f"_v{n}", f"_p{n}", lines, ind + "        ", namespace, counter)
+            body_emitted = True
+        if not body_emitted:
+            lines.append(f"{ind}    pass")
+        return
+
+    if kind == "object":
+        lines.append(f"{ind}if type({v}) is not dict:")
+        lines.append(f'{ind}    add_issue(issues, {p}, "type.mismatch", _type_msg("object", type({v})))')
+        lines.append(f"{ind}else:")
+        body_emitted = False
+        strict = bool(node.get("strict"))
+        if strict:
+            req_name = _bind_const(namespace, counter, "req",
+                                   frozenset(node.get("required") or ()))
+            opt_name = _bind_const(namespace, counter, "opt",
+                                   frozenset(node.get("optional") or ()))
+            counter[0] += 1
+            n = counter[0]
+            lines.append(f"{ind}    _k{n} = {v}.keys()")
+            lines.append(f"{ind}    for _m{n} in {req_name} - _k{n}:")
+            lines.append(f'{ind}        add_issue(issues, {p}, "field.missing", "Missing required field: " + _m{n})')
+            lines.append(f"{ind}    for _e{n} in _k{n} - {req_name} - {opt_name}:")
+            lines.append(f'{ind}        add_issue(issues, {p}, "field.unknown", "Unknown field: " + _e{n})')
+            body_emitted = True
+        for key, child in (node.get("required") or {}).items():
+            if strict:
+                # Missing keys were already reported by the set pass, so
+                # required children validate like optional ones
+                if child is None:
+                    continue
+                counter[0] += 1
+                n = counter[0]
+                lines.append(f"{ind}    _v{n} = {v}.get({key!r}, _MISSING)")
+                lines.append(f"{ind}    if _v{n} is not _MISSING:")
+                lines.append(f"{ind}        _p{n} = ({key!r}, {p})")
+                _emit_schema(child, f"_v{n}", f"_p{n}", lines, ind + "        ", namespace, counter)
+                body_emitted = True
+                continue
+            counter[0] += 1
+            n = counter[0]
+            lines.append(f"{ind}    _v{n} = {v}.get({key!r}, _MISSING)")
+            lines.append(f"{ind}    if _v{n} is _MISSING:")
+            lines.append(f'{ind}        add_issue(issues, {p}, "field.missing", {("Missing required field: " + key)!r})')
+            if child is not None:
+                lines.append(f"{ind}    else:")
+                lines.append(f"{ind}        _p{n} = ({key!r}, {p})")
+                _emit_schema(child, f"_v{n}", f"_p{n}", lines, ind + "        ", namespace, counter)
+            body_emitted = True
+        for key, child in (node.get("optional") or {}).items():
+            if child is None:
+                continue
+            counter[0] += 1
+            n = counter[0]
+            lines.append(f"{ind}    _v{n} = {v}.get({key!r}, _MISSING)")
+            lines.append(f"{ind}    if _v{n} is not _MISSING:")
+            lines.append(f"{ind}        _p{n} = ({key!r}, {p})")
+            _emit_schema(child, f"_v{n}", f"_p{n}", lines, ind + "        ", namespace, counter)
+            body_emitted = True
+        if not body_emitted:
+            lines.append(f"{ind}    pass")
+        return
+
+    if kind == "oneof":
+        options = node.get("options") or []
+        if options and all(opt.get("kind") == "literal" for opt in options):
+            lits_name = _bind_const(namespace, counter, "lits",
+                                    frozenset(opt["value"] for opt in options))
+            counter[0] += 1
+            n = counter[0]
+            lines.append(f"{ind}try:")
+            lines.append(f"{ind}    _ok{n} = {v} in {lits_name}")
+            lines.append(f"{ind}except TypeError:")
+            lines.append(f"{ind}    _ok{n} = False")
+            lines.append(f"{ind}if not _ok{n}:")
+            lines.append(f'{ind}    add_issue(issues, {p}, "oneof.no_match", "Value does not match any of the options")')
+            return
+        opts_name = _bind_const(namespace, counter, "opts",
+                                tuple(compile_schema(opt) for opt in options))
+        counter[0] += 1
+        n = counter[0]
+        lines.append(f"{ind}for _f{n} in {opts_name}:")
+        lines.append(f"{ind}    try:")
+        lines.append(f"{ind}        _f{n}({v}, {p}, _ff)")
+        lines.append(f"{ind}        break")
+        lines.append(f"{ind}    except _StopValidation:")
+        lines.append(f"{ind}        pass")
+        lines.append(f"{ind}else:")
+        lines.append(f'{ind}    add_issue(issues, {p}, "oneof.no_match", "Value does not match any of the options")')
+        return
+
+    raise ValueError(f"Unknown schema kind: {kind!r}")
+
+
+def compile_schema(schema: dict[str, Any]) -> Validator:
+    """Compile a schema IR dict into one specialized validator function.
+
+    Every primitive check is inlined into a single exec-compiled function,
+    eliminating the per-field call and kwarg-dispatch overhead of the
+    generic validators; compiled functions are cached by canonical schema
+    JSON. IR nodes are dicts keyed by "kind":
+
+        {"kind": "str", "min_length"?, "max_length"?, "pattern"?}
+        {"kind": "num", "min"?, "max"?, "integer"?}
+        {"kind": "bool"}
+        {"kind": "literal", "value"}
+        {"kind": "pattern", "pattern"}
+        {"kind": "list", "item"?, "min_items"?, "max_items"?}
+        {"kind": "object", "required"?: {key: node|None},
+                           "optional"?: {key: node|None}, "strict"?: bool}
+
+    A strict object rejects keys outside required/optional; missing and
+    unknown keys are found with set subtractions against the key view,
+    as in validate_object_strict.
+        {"kind": "oneof", "options": [node, ...]}
+    """
+    key = json.dumps(schema, sort_keys=True, default=repr)
+    cached = _COMPILED_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    namespace: dict[str, Any] = {
+        "add_issue": add_issue,
+        "_type_msg": _type_msg,
+        "_idx_str": _idx_str,
+        "_MISSING": _MISSING,
+        "_StopValidation": _StopValidation,
+        "_ff": _FAIL_FAST,
+    }
+    counter = [0]
+    lines = ["def _compiled(value, path, issues):"]
+    _emit_schema(schema, "value", "path", lines, "    ", namespace, counter)
+    exec(compile("\n".join(lines), "<compile_schema>", "exec"), namespace)
+    compiled = namespace["_compiled"]
+    _COMPILED_CACHE[key] = compiled
+    return compiled
 
 
 # === File system context ===
@@ -144,56 +873,73 @@ def matches_validator(value: Any, validator: Validator) -> bool:
 class FSContext:
     """File system access context - abstracts directory and zip file access."""
 
-    def __init__(self, base_path: str):
+    def __init__(self, base_path: str, kind: str | None = None):
+        """kind may be 'dir' or 'zip' when the caller has already detected
+        the bundle type; passing it skips the repeated stat calls and zip
+        central-directory read."""
         self.base_path = base_path
         self.is_zip = False
         self.zip_file: zipfile.ZipFile | None = None
-
-        if os.path.isdir(base_path):
-            self.is_zip = False
-        elif os.path.isfile(base_path) and zipfile.is_zipfile(base_path):
+        self._names: frozenset[str] = frozenset()
+        self._dirs: frozenset[str] = frozenset()
+
+        if kind is None:
+            if os.path.isdir(base_path):
+                kind = 'dir'
+            elif os.path.isfile(base_path) and zipfile.is_zipfile(base_path):
+                kind = 'zip'
+            else:
+                raise ValueError(f"Not a directory or zip file: {base_path}")
+
+        if kind == 'zip':
             self.is_zip = True
             self.zip_file = zipfile.ZipFile(base_path, 'r')
-        else:
-            raise ValueError(f"Not a directory or zip file: {base_path}")
+            self._build_index()
+
+    @classmethod
+    def from_kind(cls, base_path: str, kind: str) -> 'FSContext':
+        """Create a context for an already-detected bundle type."""
+        return cls(base_path, kind)
+
+    def _build_index(self) -> None:
+        """Precompute entry name and directory sets for O(1) lookups.
+
+        exists/is_file/is_dir are called repeatedly during bundle
+        validation; the namelist is materialized exactly once here instead
+        of per query.
+        """
+        names = self.zip_file.namelist()
+        self._names = frozenset(names)
+        dirs: set[str] = set()
+        for name in names:
+            # Every ancestor prefix is a directory, whether or not the
+            # zip carries an explicit entry for it
+            idx = name.find('/')
+            while idx != -1:
+                dirs.add(name[:idx])
+                idx = name.find('/', idx + 1)
+        self._dirs = frozenset(dirs)
 
     def exists(self, rel_path: str) -> bool:
         """Check if a file or directory exists."""
         if self.is_zip:
-            try:
-                self.zip_file.getinfo(rel_path)
-                return True
-            except KeyError:
-                # Try with trailing slash for directories
-                try:
-                    self.zip_file.getinfo(rel_path + '/')
-                    return True
-                except KeyError:
-                    return False
+            return (rel_path in self._names
+                    or rel_path + '/' in self._names
+                    or self.is_dir(rel_path))
         else:
             return os.path.exists(os.path.join(self.base_path, rel_path))
 
     def is_file(self, rel_path: str) -> bool:
         """Check if path is a file."""
         if self.is_zip:
-            try:
-                info = self.zip_file.getinfo(rel_path)
-                return not info.is_dir()
-            except KeyError:
-                return False
+            return rel_path in self._names and not rel_path.endswith('/')
         else:
             return os.path.isfile(os.path.join(self.base_path, rel_path))
 
     def is_dir(self, rel_path: str) -> bool:
         """Check if path is a directory."""
         if self.is_zip:
-            try:
-                info = self.zip_file.getinfo(rel_path + '/')
-                return info.is_dir()
-            except KeyError:
-                # Check if any files start with this path
-                prefix = rel_path + '/'
-                return any(name.startswith(prefix) for name in self.zip_file.namelist())
+            return rel_path in self._dirs
         else:
             return os.path.isdir(os.path.join(self.base_path, rel_path))
 
@@ -205,8 +951,24 @@ class FSContext:
             with open(os.path.join(self.base_path, rel_path), 'r', encoding='utf-8') as f:
                 return f.read()
 
+    def read_bytes(self, rel_path: str) -> bytes:
+        """Read file content as raw bytes."""
+        if self.is_zip:
+            return self.zip_file.read(rel_path)
+        else:
+            with open(os.path.join(self.base_path, rel_path), 'rb') as f:
+                return f.read()
+
     def read_json(self, rel_path: str) -> Any:
-        """Read and parse JSON file."""
+        """Read and parse JSON file.
+
+        Parses the raw bytes with orjson when it is installed (orjson
+        decodes utf-8 internally, in C); otherwise stdlib json on the
+        decoded string. orjson.JSONDecodeError subclasses
+        json.JSONDecodeError, so callers catch either the same way.
+        """
+        if _orjson is not None:
+            return _orjson.loads(self.read_bytes(rel_path))
         return json.loads(self.read(rel_path))
 
     def basename(self) -> str:
@@ -224,19 +986,14 @@ class FSContext:
 
 # === File system validators ===
 
-FSValidator: TypeAlias = Callable[['FSContext', list[str], Issues], None]
+FSValidator: TypeAlias = Callable[['FSContext', 'PathChain', Issues], None]
 
 
-def validate_bundle(path: str, path_list: list[str], issues: Issues,
-                    accept_dir: bool = True,
-                    accept_zip: bool = False,
-                    zip_ext: str | None = None,
-                    name_pattern: str | None = None,
-                    content_validator: FSValidator | None = None) -> FSContext | None:
-    """
-    Validate a bundle (directory or zip file).
-    Returns FSContext if successful, None otherwise.
-    """
+def _validate_bundle_impl(path: str, path_list: "PathChain", issues: Issues,
+                          accept_dir: bool, accept_zip: bool,
+                          suffix: str | None, name_match: Any,
+                          content_validator: FSValidator | None) -> FSContext | None:
+    """Bundle validation core, taking the preprocessed configuration."""
     is_dir = os.path.isdir(path)
     is_zip = not is_dir and os.path.isfile(path) and zipfile.is_zipfile(path)
 
@@ -252,22 +1009,22 @@ def validate_bundle(path: str, path_list: list[str], issues: Issues,
         return None
 
     # Check zip extension
-    if is_zip and zip_ext:
-        if not path.endswith(f'.{zip_ext}'):
-            add_issue(issues, path_list, "bundle.wrong_ext", f"Expected .{zip_ext} extension")
+    if is_zip and suffix:
+        if not path.endswith(suffix):
+            add_issue(issues, path_list, "bundle.wrong_ext", f"Expected {suffix} extension")
             return None
 
-    # Create context
+    # Create context, reusing the detection done above
     try:
-        ctx = FSContext(path)
+        ctx = FSContext.from_kind(path, 'dir' if is_dir else 'zip')
     except Exception as e:
         add_issue(issues, path_list, "bundle.open_error", str(e))
         return None
 
     # Validate name pattern
-    if name_pattern:
+    if name_match:
         name = ctx.basename()
-        if not re.match(name_pattern, name):
+        if not name_match(name):
             add_issue(issues, path_list, "bundle.name_mismatch", f"Name '{name}' does not match pattern")
 
     # Validate content
@@ -277,10 +1034,49 @@ def validate_bundle(path: str, path_list: list[str], issues: Issues,
     return ctx
 
 
-def validate_json_file(ctx: FSContext, rel_path: str, path: list[str], issues: Issues,
+def validate_bundle(path: str, path_list: "PathChain", issues: Issues,
+                    accept_dir: bool = True,
+                    accept_zip: bool = False,
+                    zip_ext: str | None = None,
+                    name_pattern: str | None = None,
+                    content_validator: FSValidator | None = None) -> FSContext | None:
+    """
+    Validate a bundle (directory or zip file).
+    Returns FSContext if successful, None otherwise.
+    """
+    return _validate_bundle_impl(
+        path, path_list, issues, accept_dir, accept_zip,
+        f'.{zip_ext}' if zip_ext else None,
+        _get_pattern(name_pattern).match if name_pattern else None,
+        content_validator)
+
+
+def make_bundle_validator(accept_dir: bool = True,
+                          accept_zip: bool = False,
+                          zip_ext: str | None = None,
+                          name_pattern: str | None = None,
+                          content_validator: FSValidator | None = None,
+                          ) -> Callable[[str, "PathChain", Issues], FSContext | None]:
+    """Build a bundle validator with its configuration prebound.
+
+    The compiled name pattern and formatted zip suffix are captured once
+    here instead of being re-derived on every call - codegen emits this
+    once per bundle schema.
+    """
+    suffix = f'.{zip_ext}' if zip_ext else None
+    name_match = _get_pattern(name_pattern).match if name_pattern else None
+
+    def _validator(path: str, path_list: "PathChain", issues: Issues) -> FSContext | None:
+        return _validate_bundle_impl(path, path_list, issues, accept_dir, accept_zip,
+                                     suffix, name_match, content_validator)
+
+    return _validator
+
+
+def validate_json_file(ctx: FSContext, rel_path: str, path: "PathChain", issues: Issues,
                        content_validator: Validator | None = None) -> Any | None:
     """Validate a JSON file within a bundle context."""
-    file_path = path + [rel_path]
+    file_path = (rel_path, path)
 
     if not ctx.exists(rel_path):
         add_issue(issues, file_path, "file.not_found", f"File not found: {rel_path}")
@@ -305,10 +1101,10 @@ def validate_json_file(ctx: FSContext, rel_path: str, path: list[str], issues: I
     return content
 
 
-def validate_fs_file(ctx: FSContext, rel_path: str, path: list[str], issues: Issues,
+def validate_fs_file(ctx: FSContext, rel_path: str, path: "PathChain", issues: Issues,
                      ext: str | None = None) -> bool:
     """Validate a file exists within a bundle context."""
-    file_path = path + [rel_path]
+    file_path = (rel_path, path)
 
     if not ctx.exists(rel_path):
         add_issue(issues, file_path, "file.not_found", f"File not found: {rel_path}")
@@ -327,9 +1123,9 @@ def validate_fs_file(ctx: FSContext, rel_path: str, path: list[str], issues: Iss
     return True
 
 
-def validate_fs_directory(ctx: FSContext, rel_path: str, path: list[str], issues: Issues) -> bool:
+def validate_fs_directory(ctx: FSContext, rel_path: str, path: "PathChain", issues: Issues) -> bool:
     """Validate a directory exists within a bundle context."""
-    dir_path = path + [rel_path]
+    dir_path = (rel_path, path)
 
     if not ctx.exists(rel_path):
         add_issue(issues, dir_path, "dir.not_found", f"Directory not found: {rel_path}")
@@ -344,23 +1140,70 @@ def validate_fs_directory(ctx: FSContext, rel_path: str, path: list[str], issues
 
 # === Entry points ===
 
-def validate(value: Any, validator: Validator) -> dict[str, Any]:
-    """Run validation on a value and return result."""
-    issues: Issues = []
-    validator(value, [], issues)
+def validate(value: Any, validator: Validator, stop_on_first: bool = False) -> dict[str, Any]:
+    """Run validation on a value and return result.
+
+    With stop_on_first, validation unwinds at the first issue and the
+    result contains only that issue.
+    """
+    issues = Issues()
+    if stop_on_first:
+        try:
+            validator(value, None, _FAIL_FAST)
+        except _StopValidation as stop:
+            issues.add(*stop.args[0])
+    else:
+        validator(value, None, issues)
+    return {
+        "ok": len(issues) == 0,
+        "issues": issues.to_dicts()
+    }
+
+
+def validate_fast(value: Any, validator: Validator) -> bool:
+    """Test validity only, unwinding on the first issue.
+
+    Equivalent to validate(value, validator)[\"ok\"] but O(first failure)
+    instead of running the full validator and formatting every issue.
+    """
+    try:
+        validator(value, None, _FAIL_FAST)
+        return True
+    except _StopValidation:
+        return False
+
+
+def validate_iterative(value: Any, validator: Validator) -> dict[str, Any]:
+    """Run validation with an explicit work stack instead of recursion.
+
+    Container validators push child work items onto the stack rather than
+    calling into themselves, so one interpreter frame handles the whole
+    tree and schema depth is bounded by memory, not the recursion limit.
+    Issues surface in traversal order but parents complete before their
+    children, unlike the depth-first interleaving of validate.
+    """
+    issues = Issues()
+    stack: list[tuple[Any, "PathChain", Validator]] = [(value, None, validator)]
+    _WORK.stack = stack
+    try:
+        while stack:
+            item, item_path, item_validator = stack.pop()
+            item_validator(item, item_path, issues)
+    finally:
+        _WORK.stack = None
     return {
         "ok": len(issues) == 0,
-        "issues": issues
+        "issues": issues.to_dicts()
     }
 
 
-def validate_path(path: str, validator: Callable[[str, list[str], Issues], FSContext | None]) -> dict[str, Any]:
+def validate_path(path: str, validator: Callable[[str, 'PathChain', Issues], FSContext | None]) -> dict[str, Any]:
     """Run validation on a file system path and return result."""
-    issues: Issues = []
-    ctx = validator(path, [], issues)
+    issues = Issues()
+    ctx = validator(path, None, issues)
     if ctx:
         ctx.close()
     return {
         "ok": len(issues) == 0,
-        "issues": issues
+        "issues": issues.to_dicts()
     }
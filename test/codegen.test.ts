@@ -127,6 +127,38 @@ describe('Code generator validation logic', () => {
     });
   });
 
+  describe('Object validation', () => {
+    it('fuses object fields into a single dispatch call', () => {
+      const desc: TypeDescription = {
+        name: 'Object',
+        children: {
+          required: [{ name: 'Field', key: 'name', summary: 'String' }],
+          optional: [{ name: 'Field', key: 'age', summary: 'Number' }],
+        },
+      };
+
+      const pyCode = generatePython(desc);
+      expect(pyCode).toContain('validate_object_fields');
+      expect(pyCode).toContain('required=(("name", validate_str),)');
+      expect(pyCode).toContain('optional=(("age", validate_num),)');
+    });
+
+    it('hoists constructed validators out of nested lambdas', () => {
+      const desc: TypeDescription = {
+        name: 'Object',
+        children: {
+          required: [
+            { name: 'Field', key: 'name', summary: 'String', constraints: ['minimum 3 characters'] },
+          ],
+        },
+      };
+
+      const pyCode = generatePython(desc);
+      expect(pyCode).toContain('_str1 = make_str_validator(min_length=3)');
+      expect(pyCode).toContain('required=(("name", _str1),)');
+    });
+  });
+
   describe('String validation', () => {
     it('generates string validator with constraints', () => {
       const desc: TypeDescription = {
@@ -135,6 +167,7 @@ describe('Code generator validation logic', () => {
       };
 
       const pyCode = generatePython(desc);
+      expect(pyCode).toContain('make_str_validator(');
       expect(pyCode).toContain('min_length=3');
       expect(pyCode).toContain('max_length=20');
 
@@ -196,13 +229,28 @@ describe('Code generator validation logic', () => {
       };
 
       const pyCode = generatePython(desc);
-      expect(pyCode).toContain('validate_oneof');
+      expect(pyCode).toContain('validate_oneof_literals');
       expect(pyCode).toContain('"a"');
       expect(pyCode).toContain('"b"');
 
       const tsCode = generateTypeScript(desc);
       expect(tsCode).toContain('validateOneOf');
     });
+
+    it('generates type-dispatched oneof for mixed branch types', () => {
+      const desc: TypeDescription = {
+        name: 'OneOf',
+        oneOf: [
+          { name: 'String' },
+          { name: 'Number' },
+        ],
+      };
+
+      const pyCode = generatePython(desc);
+      expect(pyCode).toContain('validate_oneof_dispatch');
+      expect(pyCode).toContain('str:');
+      expect(pyCode).toContain('int:');
+    });
   });
 
   describe('ListOf validation', () => {
@@ -223,6 +271,18 @@ describe('Code generator validation logic', () => {
       expect(tsCode).toContain('minItems: 1');
       expect(tsCode).toContain('maxItems: 10');
     });
+
+    it('generates bulk numeric list validator', () => {
+      const desc: TypeDescription = {
+        name: 'ListOf',
+        itemType: { name: 'Number', constraints: ['minimum 0', 'maximum 1'] },
+      };
+
+      const pyCode = generatePython(desc);
+      expect(pyCode).toContain('validate_num_list');
+      expect(pyCode).toContain('min_val=0');
+      expect(pyCode).toContain('max_val=1');
+    });
   });
 
   describe('FS item description comments', () => {